@@ -38,11 +38,11 @@ class ExampleTest(BitcoinTestFramework):
         # Build + broadcast a simple self-transfer transaction
         wallet.send_self_transfer(from_node=self.nodes[0])
 
-        assert len(self.nodes[0].getrawmempool()) == 1
+        assert self.nodes[0].getmempoolinfo()['size'] == 1
 
         self.generate(self.nodes[0], 1)
 
-        mempool_length = len(self.nodes[0].getrawmempool())
+        mempool_length = self.nodes[0].getmempoolinfo()['size']
         assert mempool_length == 0
         self.log.info("Mempool ok")
 
@@ -2,19 +2,34 @@
 # Copyright (c) 2017-present The Bitcoin Core developers
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or http://www.opensource.org/licenses/mit-license.php.
-"""An example functional test
+"""Test that the node answers a ping with a pong carrying the same nonce.
 
-The module-level docstring should include a high-level description of
-what the test is doing. It's the first thing people see when they open
-the file and should give the reader information about *what* the test
-is testing and *how* it's being tested
+A P2P connection sends a single ping message to the node, waits for the next
+pong to arrive and checks that its nonce matches the one that was sent.
 """
+import threading
 
 from test_framework.util import assert_equal
 from test_framework.messages import msg_ping
 from test_framework.p2p import P2PInterface
 from test_framework.test_framework import BitcoinTestFramework
 
+# Distinct from the nonces used by sync_with_ping (0 and a small counter)
+PING_NONCE = 0x1234_5678
+
+
+class PongNode(P2PInterface):
+    def __init__(self):
+        super().__init__()
+        # Set by the network thread once a pong has been received
+        self._pong = threading.Event()
+        self._nonce = None
+
+    def on_pong(self, message):
+        self._nonce = message.nonce
+        self._pong.set()
+
+
 class ExampleTest(BitcoinTestFramework):
     # Each functional test is a subclass of the BitcoinTestFramework class.
 
@@ -25,10 +40,21 @@ class ExampleTest(BitcoinTestFramework):
         """Override test parameters for your individual test.
 
         This method must be overridden and num_nodes must be explicitly set."""
+        # Answering a ping needs no chain, so skip copying the cached chain
+        # and syncing a fresh tip at startup.
+        self.setup_clean_chain = True
         self.num_nodes = 1
 
     def run_test(self):
         """Main test logic"""
+        p2p_conn = self.nodes[0].add_p2p_connection(PongNode())
+
+        self.log.info("Send ping and wait for the matching pong")
+        # add_p2p_connection() already exchanged pings via sync_with_ping()
+        p2p_conn._pong.clear()
+        p2p_conn.send_without_ping(msg_ping(nonce=PING_NONCE))
+        assert p2p_conn._pong.wait(5 * self.options.timeout_factor)
+        assert_equal(p2p_conn._nonce, PING_NONCE)
 
 if __name__ == '__main__':
     ExampleTest(__file__).main()
@@ -29,19 +29,23 @@ ServiceProxy class:
 - sends "jsonrpc":"2.0", per JSON-RPC 2.0
 - sends proper, incrementing 'id'
 - sends Basic HTTP authentication headers
-- parses all JSON numbers that look like floats as Decimal
+- parses all JSON numbers that look like floats as Decimal (or with a custom
+  amount_parser, e.g. parse_amount_sats)
 - uses standard Python json lib
 """
 
 import base64
 import decimal
+import functools
 from http import HTTPStatus
 import http.client
 import json
 import logging
 import pathlib
+import re
 import socket
 import time
+import unittest
 import urllib.parse
 
 HTTP_TIMEOUT = 30
@@ -63,14 +67,35 @@ def serialization_fallback(o):
         return str(o)
     raise TypeError(repr(o) + " is not JSON serializable")
 
+
+@functools.cache
+def _json_decoder(parse_float):
+    """Return a shared JSONDecoder, since json.loads() with a custom
+    parse_float builds a new decoder (and scanner) on every call."""
+    return json.JSONDecoder(parse_float=parse_float)
+
+
+def parse_amount_sats(s):
+    """Parse a JSON amount with at most 8 decimal places as integer satoshis.
+
+    Can be passed as amount_parser to AuthServiceProxy to avoid constructing
+    Decimal objects. Only suitable for proxies whose float-like results are
+    all BTC amounts."""
+    if not re.fullmatch(r"-?[0-9]+(\.[0-9]{1,8})?", s):
+        raise ValueError(f"{s} is not an amount with at most 8 decimal places")
+    whole, _, frac = s.partition('.')
+    return int(whole + frac.ljust(8, '0'))
+
 class AuthServiceProxy():
     __id_count = 0
 
     # ensure_ascii: escape unicode as \uXXXX, passed to json.dumps
-    def __init__(self, service_url, service_name=None, timeout=HTTP_TIMEOUT, connection=None, ensure_ascii=True):
+    # amount_parser: called with the string of every JSON float, used as parse_float when decoding responses
+    def __init__(self, service_url, service_name=None, timeout=HTTP_TIMEOUT, connection=None, ensure_ascii=True, amount_parser=decimal.Decimal):
         self.__service_url = service_url
         self._service_name = service_name
         self.ensure_ascii = ensure_ascii  # can be toggled on the fly by tests
+        self.amount_parser = amount_parser  # can be toggled on the fly by tests
         self.reuse_http_connections = True
         self.__url = urllib.parse.urlparse(service_url)
         user = None if self.__url.username is None else self.__url.username.encode('utf8')
@@ -87,11 +112,41 @@ class AuthServiceProxy():
         if name.startswith('__') and name.endswith('__'):
             # Python internal stuff
             raise AttributeError
+        attr = name
         if self._service_name is not None:
             name = "%s.%s" % (self._service_name, name)
         if not self.reuse_http_connections:
             self._set_conn()
-        return AuthServiceProxy(self.__service_url, name, connection=self.__conn)
+            return AuthServiceProxy(self.__service_url, name, connection=self.__conn, amount_parser=self.amount_parser)
+        child = AuthServiceProxy(self.__service_url, name, connection=self.__conn, amount_parser=self.amount_parser)
+        # Cache the method proxy in the instance dict, so that later lookups of
+        # the same RPC name no longer reach __getattr__.
+        self.__dict__[attr] = child
+        return child
+
+    def _drop_cached_methods(self):
+        """Drop the method proxies cached by __getattr__, so that they are
+        recreated with the current settings on next use."""
+        for attr in [attr for attr, value in vars(self).items() if isinstance(value, AuthServiceProxy)]:
+            del self.__dict__[attr]
+
+    @property
+    def amount_parser(self):
+        return self._amount_parser
+
+    @amount_parser.setter
+    def amount_parser(self, amount_parser):
+        self._amount_parser = amount_parser
+        self._drop_cached_methods()
+
+    @property
+    def reuse_http_connections(self):
+        return self._reuse_http_connections
+
+    @reuse_http_connections.setter
+    def reuse_http_connections(self, reuse_http_connections):
+        self._reuse_http_connections = reuse_http_connections
+        self._drop_cached_methods()
 
     def _request(self, method, path, postdata):
         '''
@@ -112,12 +167,13 @@ class AuthServiceProxy():
     def get_request(self, *args, **argsn):
         AuthServiceProxy.__id_count += 1
 
-        log.debug("-{}-> {} {} {}".format(
-            AuthServiceProxy.__id_count,
-            self._service_name,
-            self._json_dumps(args),
-            self._json_dumps(argsn),
-        ))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("-{}-> {} {} {}".format(
+                AuthServiceProxy.__id_count,
+                self._service_name,
+                self._json_dumps(args),
+                self._json_dumps(argsn),
+            ))
 
         if args and argsn:
             params = dict(args=args, **argsn)
@@ -157,7 +213,7 @@ class AuthServiceProxy():
 
     def batch(self, rpc_call_list):
         postdata = self._json_dumps(list(rpc_call_list))
-        log.debug("--> " + postdata)
+        log.debug("--> %s", postdata)
         response, status = self._request('POST', self.__url.path, postdata.encode('utf-8'))
         if status != HTTPStatus.OK:
             raise JSONRPCException({
@@ -200,16 +256,17 @@ class AuthServiceProxy():
         except UnicodeDecodeError as e:
             raise JSONRPCException({
                 'code': -342, 'message': f'Cannot decode response in utf8 format, content: {data}, exception: {e}'})
-        response = json.loads(responsedata, parse_float=decimal.Decimal)
-        elapsed = time.time() - req_start_time
-        if "error" in response and response["error"] is None:
-            log.debug("<-%s- [%.6f] %s" % (response["id"], elapsed, self._json_dumps(response["result"])))
-        else:
-            log.debug("<-- [%.6f] %s" % (elapsed, responsedata))
+        response = _json_decoder(self.amount_parser).decode(responsedata)
+        if log.isEnabledFor(logging.DEBUG):
+            elapsed = time.time() - req_start_time
+            if "error" in response and response["error"] is None:
+                log.debug("<-%s- [%.6f] %s" % (response["id"], elapsed, self._json_dumps(response["result"])))
+            else:
+                log.debug("<-- [%.6f] %s" % (elapsed, responsedata))
         return response, http_response.status
 
     def __truediv__(self, relative_uri):
-        return AuthServiceProxy("{}/{}".format(self.__service_url, relative_uri), self._service_name, connection=self.__conn)
+        return AuthServiceProxy("{}/{}".format(self.__service_url, relative_uri), self._service_name, connection=self.__conn, amount_parser=self.amount_parser)
 
     def _set_conn(self, connection=None):
         port = 80 if self.__url.port is None else self.__url.port
@@ -220,3 +277,15 @@ class AuthServiceProxy():
             self.__conn = http.client.HTTPSConnection(self.__url.hostname, port, timeout=self.timeout)
         else:
             self.__conn = http.client.HTTPConnection(self.__url.hostname, port, timeout=self.timeout)
+
+
+class TestFrameworkAuthproxy(unittest.TestCase):
+    def test_parse_amount_sats(self):
+        self.assertEqual(parse_amount_sats("50"), 50_00000000)
+        self.assertEqual(parse_amount_sats("0.00000001"), 1)
+        self.assertEqual(parse_amount_sats("12.3456789"), 12_34567890)
+        self.assertEqual(parse_amount_sats("-0.5"), -50000000)
+        self.assertEqual(parse_amount_sats("-21"), -21_00000000)
+        for s in ["0.000000001", "1e-05", "-1E8", "1.", ".5", "--1", "1.-5", ""]:
+            with self.assertRaisesRegex(ValueError, "is not an amount with at most 8 decimal places"):
+                parse_amount_sats(s)
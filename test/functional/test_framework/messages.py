@@ -103,7 +103,7 @@ def sha3(s):
 
 
 def hash256(s):
-    return sha256(sha256(s))
+    return hashlib.sha256(hashlib.sha256(s).digest()).digest()
 
 
 def ser_compact_size(l):
@@ -762,14 +762,14 @@ class CBlockHeader:
         return self._serialize_header()
 
     def _serialize_header(self):
-        r = b""
-        r += self.nVersion.to_bytes(4, "little", signed=True)
-        r += ser_uint256(self.hashPrevBlock)
-        r += ser_uint256(self.hashMerkleRoot)
-        r += self.nTime.to_bytes(4, "little")
-        r += self.nBits.to_bytes(4, "little")
-        r += self.nNonce.to_bytes(4, "little")
-        return r
+        return b"".join((
+            self.nVersion.to_bytes(4, "little", signed=True),
+            ser_uint256(self.hashPrevBlock),
+            ser_uint256(self.hashMerkleRoot),
+            self.nTime.to_bytes(4, "little"),
+            self.nBits.to_bytes(4, "little"),
+            self.nNonce.to_bytes(4, "little"),
+        ))
 
     @property
     def hash_hex(self):
@@ -1434,9 +1434,7 @@ class msg_ping:
         self.nonce = int.from_bytes(f.read(8), "little")
 
     def serialize(self):
-        r = b""
-        r += self.nonce.to_bytes(8, "little")
-        return r
+        return self.nonce.to_bytes(8, "little")
 
     def __repr__(self):
         return "msg_ping(nonce=%08x)" % self.nonce
@@ -1453,9 +1451,7 @@ class msg_pong:
         self.nonce = int.from_bytes(f.read(8), "little")
 
     def serialize(self):
-        r = b""
-        r += self.nonce.to_bytes(8, "little")
-        return r
+        return self.nonce.to_bytes(8, "little")
 
     def __repr__(self):
         return "msg_pong(nonce=%08x)" % self.nonce
@@ -76,7 +76,7 @@ from test_framework.messages import (
     NODE_NETWORK,
     NODE_WITNESS,
     MAGIC_BYTES,
-    sha256,
+    hash256,
 )
 from test_framework.netutil import (
     set_ephemeral_port_range,
@@ -361,9 +361,7 @@ class P2PConnection(asyncio.Protocol):
                     if len(self.recvbuf) < 4 + 12 + 4 + 4 + msglen:
                         return
                     msg = self.recvbuf[4+12+4+4:4+12+4+4+msglen]
-                    th = sha256(msg)
-                    h = sha256(th)
-                    if checksum != h[:4]:
+                    if checksum != hash256(msg)[:4]:
                         raise ValueError("got bad checksum " + repr(self.recvbuf))
                     self.recvbuf = self.recvbuf[4+12+4+4+msglen:]
                 if msgtype not in MESSAGEMAP:
@@ -428,15 +426,13 @@ class P2PConnection(asyncio.Protocol):
             tmsg += data
             return self.v2_state.v2_enc_packet(tmsg, ignore=is_decoy)
         else:
-            tmsg = self.magic_bytes
-            tmsg += msgtype
-            tmsg += b"\x00" * (12 - len(msgtype))
-            tmsg += len(data).to_bytes(4, "little")
-            th = sha256(data)
-            h = sha256(th)
-            tmsg += h[:4]
-            tmsg += data
-            return tmsg
+            return b"".join((
+                self.magic_bytes,
+                msgtype.ljust(12, b"\x00"),
+                len(data).to_bytes(4, "little"),
+                hash256(data)[:4],
+                data,
+            ))
 
     def _log_message(self, direction, msg):
         """Logs a message being sent or received over the connection."""
@@ -31,6 +31,7 @@ from .util import (
     PortSeed,
     assert_equal,
     check_json_precision,
+    copy_file,
     export_env_build_path,
     find_vout_for_address,
     get_binary_paths,
@@ -854,7 +855,7 @@ class BitcoinTestFramework(metaclass=BitcoinTestMetaClass):
         for i in range(self.num_nodes):
             self.log.debug("Copy cache directory {} to node {}".format(cache_node_dir, i))
             to_dir = get_datadir_path(self.options.tmpdir, i)
-            shutil.copytree(cache_node_dir, to_dir)
+            shutil.copytree(cache_node_dir, to_dir, copy_function=copy_file)
             initialize_datadir(self.options.tmpdir, i, self.chain, self.disable_autoconnect)  # Overwrite port/rpcport in bitcoin.conf
 
     def _initialize_chain_clean(self):
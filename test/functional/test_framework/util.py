@@ -7,6 +7,7 @@
 from base64 import b64encode
 from decimal import Decimal
 from subprocess import CalledProcessError
+import errno
 import hashlib
 import inspect
 import json
@@ -17,6 +18,7 @@ import platform
 import random
 import re
 import shlex
+import shutil
 import time
 import types
 
@@ -437,6 +439,36 @@ def sha256sum_file(filename):
     return h.digest()
 
 
+def copy_file(src, dst):
+    """Copy a file and its metadata, like shutil.copy2(), using os.copy_file_range() where available.
+
+    This lets the kernel copy the data without passing it through user space,
+    and share the extents instead on filesystems with reflink support (e.g.
+    btrfs, XFS). Falls back to shutil.copy2() where copy_file_range is not
+    supported, or where it copies nothing at all (as on some FUSE, NFS and
+    procfs-like mounts). Can be passed as copy_function to shutil.copytree()."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            if copied == size:
+                shutil.copystat(src, dst)
+                return dst
+            if copied > 0:
+                raise RuntimeError(f"copy_file_range stopped after {copied} of {size} bytes copying {src} to {dst}")
+        except OSError as e:
+            # Not supported by the kernel or filesystem, or across filesystems
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY):
+                raise
+    return shutil.copy2(src, dst)
+
+
 def util_xor(data, key, *, offset):
     data = bytearray(data)
     for i in range(len(data)):
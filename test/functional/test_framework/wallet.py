@@ -33,6 +33,7 @@ from test_framework.messages import (
     CTxInWitness,
     CTxOut,
     hash256,
+    tx_from_hex,
 )
 from test_framework.script import (
     CScript,
@@ -149,18 +150,27 @@ class MiniWallet:
 
     def scan_tx(self, tx):
         """Scan the tx and adjust the internal list of owned utxos"""
-        for spent in tx["vin"]:
-            # Mark spent. This may happen when the caller has ownership of a
-            # utxo that remained in this wallet. For example, by passing
-            # mark_as_spent=False to get_utxo or by using an utxo returned by a
-            # create_self_transfer* call.
-            try:
-                self.get_utxo(txid=spent["txid"], vout=spent["vout"])
-            except StopIteration:
-                pass
-        for out in tx['vout']:
-            if out['scriptPubKey']['hex'] == self._scriptPubKey.hex():
-                self._utxos.append(self._create_utxo(txid=tx["txid"], vout=out["n"], value=out["value"], height=0, coinbase=False, confirmations=0))
+        # Mark spent. This may happen when the caller has ownership of a
+        # utxo that remained in this wallet. For example, by passing
+        # mark_as_spent=False to get_utxo or by using an utxo returned by a
+        # create_self_transfer* call.
+        spent = {(txin["txid"], txin["vout"]) for txin in tx["vin"]}
+        outputs = [(out["n"], out["value"]) for out in tx["vout"] if out["scriptPubKey"]["hex"] == self._scriptPubKey.hex()]
+        self._update_utxos(tx["txid"], spent, outputs)
+
+    def _scan_ctransaction(self, tx):
+        """Like scan_tx, but for a CTransaction object, so no RPC is needed to decode it"""
+        spent = {(f"{txin.prevout.hash:064x}", txin.prevout.n) for txin in tx.vin}
+        outputs = [(n, Decimal(out.nValue) / COIN) for n, out in enumerate(tx.vout) if out.scriptPubKey == self._scriptPubKey]
+        self._update_utxos(tx.txid_hex, spent, outputs)
+
+    def _update_utxos(self, txid, spent, outputs):
+        """Remove the spent (txid, vout) outpoints from the internal list of
+        owned utxos and add the given (vout, value) outputs of txid"""
+        self._utxos = [utxo for utxo in self._utxos if (utxo['txid'], utxo['vout']) not in spent]
+        self._utxos.sort(key=lambda k: (k['value'], -k['height']))
+        for vout, value in outputs:
+            self._utxos.append(self._create_utxo(txid=txid, vout=vout, value=value, height=0, coinbase=False, confirmations=0))
 
     def scan_txs(self, txs):
         for tx in txs:
@@ -389,7 +399,7 @@ class MiniWallet:
 
     def sendrawtransaction(self, *, from_node, tx_hex, maxfeerate=0, **kwargs):
         txid = from_node.sendrawtransaction(hexstring=tx_hex, maxfeerate=maxfeerate, **kwargs)
-        self.scan_tx(from_node.decoderawtransaction(tx_hex))
+        self._scan_ctransaction(tx_from_hex(tx_hex))
         return txid
 
     def create_self_transfer_chain(self, *, chain_length, utxo_to_spend=None):
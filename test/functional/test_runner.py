@@ -101,10 +101,7 @@ BASE_SCRIPTS = [
     # Scripts that are run by default.
     # Longest test should go first, to favor running tests in parallel
     # vv Tests less than 5m vv
-    'p2p_ping_pong.py',
-    'feature_miniwallet.py',
     'feature_prune_debug_log.py',
-    'wallet_rpc_basics.py',
     'feature_hello_world.py',
     'feature_fee_estimation.py',
     'feature_taproot.py',
@@ -155,6 +152,9 @@ BASE_SCRIPTS = [
     'feature_config_args.py',
     'wallet_listtransactions.py',
     'wallet_miniscript.py',
+    'feature_miniwallet.py',
+    'p2p_ping_pong.py',
+    'wallet_rpc_basics.py',
     # vv Tests less than 30s vv
     'p2p_invalid_messages.py',
     'rpc_createmultisig.py',
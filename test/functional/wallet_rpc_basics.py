@@ -11,17 +11,17 @@ is testing and *how* it's being tested
 """
 # Imports should be in PEP8 ordering (std library first, then third party
 # libraries then local imports).
-from collections import defaultdict
-from decimal import Decimal
 
 # Avoid wildcard * imports
 # Use lexicographically sorted multi-line imports
+from test_framework.authproxy import parse_amount_sats
 from test_framework.blocktools import (
     create_block,
     create_coinbase,
 )
 from test_framework.messages import (
     CInv,
+    COIN,
     MSG_BLOCK,
 )
 from test_framework.p2p import (
@@ -33,7 +33,9 @@ from test_framework.p2p import (
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import (
     assert_equal,
+    wallet_importprivkey,
 )
+from test_framework.wallet_util import get_generate_key
 
 # P2PInterface is a class containing callbacks to be executed when a P2P
 # message is received from the node-under-test. Subclass P2PInterface and
@@ -52,13 +54,14 @@ class BaseNode(P2PInterface):
         initialize custom properties."""
         super().__init__()
         # Stores a dictionary of all blocks received
-        self.block_receive_map = defaultdict(int)
+        self.block_receive_map = {}
 
     def on_block(self, message):
         """Override the standard on_block callback
 
         Store the hash of a received block in the dictionary."""
-        self.block_receive_map[message.block.hash_int] += 1
+        h = message.block.hash_int
+        self.block_receive_map[h] = self.block_receive_map.get(h, 0) + 1
 
     def on_inv(self, message):
         """Override the standard on_inv callback"""
@@ -82,8 +85,13 @@ class ExampleTest(BitcoinTestFramework):
     def set_test_params(self):
         """Override test parameters for your individual test.
         This method must be overridden and num_nodes must be explicitly set."""
-        self.setup_clean_chain = True
+        # Start from the cached 200-block chain instead of mining 101 blocks.
+        # The framework creates w1 on node0 and imports the deterministic
+        # coinbase key into it, so it already holds mature coins. The list is
+        # truncated so that node1 gets no wallet (and no coinbase coins).
+        self.setup_clean_chain = False
         self.num_nodes = 2
+        self.wallet_names = ["w1"]
 
 
     # Use skip_test_if_missing_module() to skip the test if your test requires certain modules to be present.
@@ -133,40 +141,52 @@ class ExampleTest(BitcoinTestFramework):
     def run_test(self):
         """Main test logic"""
         self.log.info("Setup wallets...")
-        self.nodes[0].createwallet(wallet_name="w1")
-        w1 = self.nodes[0].get_wallet_rpc("w1")
-        addr_w1 = w1.getnewaddress()
-        self.nodes[1].createwallet(wallet_name="w2")
-        w2 = self.nodes[1].get_wallet_rpc("w2")
+        # Decode amounts returned by the wallets as integer satoshis
+        w1 = self.nodes[0].get_wallet_rpc("w1", amount_parser=parse_amount_sats)
+        # w2 only ever needs a single receiving address, so create it blank
+        # and import one key instead of having it generate a full HD keypool.
+        self.nodes[1].createwallet(wallet_name="w2", blank=True)
+        w2 = self.nodes[1].get_wallet_rpc("w2", amount_parser=parse_amount_sats)
+        key_w2 = get_generate_key()
+        wallet_importprivkey(w2, key_w2.privkey, "now")
         self.log.info("Wallets connected")
 
-        # Generate 101 blocks and reward to w1
-        self.generatetoaddress(self.nodes[0], 101, addr_w1)
-        assert_equal(w1.getbalance(), Decimal("50.00000000"))
+        # w1 holds node0's 25 mature 50 BTC coinbase outputs of the cached chain
+        balance_w1 = w1.getbalance()
+        assert_equal(balance_w1, 1250 * COIN)
         self.log.info("Wallet 1 with balance")
         
         # Send to addr from w2
-        addr_w2 = w2.getnewaddress()
+        addr_w2 = key_w2.p2wpkh_addr
         txid = w1.sendtoaddress(addr_w2, 1)
         self.log.info("BTC sended to w1")
 
-        # Check mempools
-        self.sync_mempools()
-        entry = self.nodes[0].getmempoolentry(txid)
+        # Check mempools. Wait for this specific transaction rather than
+        # calling sync_mempools(), which sleeps a full second between polls.
+        self.wait_until(lambda: all(txid in node.getrawmempool() for node in self.nodes))
+        # Fetch all of node0's state in a single batched round-trip. Batches
+        # are per connection, so node1's mempool is still a separate call.
+        entry, mempool_0, balance_w1_after = [res["result"] for res in w1.batch([
+            w1.getmempoolentry.get_request(txid),
+            w1.getrawmempool.get_request(),
+            w1.getbalance.get_request(),
+        ])]
         assert entry is not None
-        assert_equal(self.nodes[1].getrawmempool(), self.nodes[0].getrawmempool())
+        # Compare as sets: the txid order returned by getrawmempool is not
+        # guaranteed to match between nodes.
+        assert_equal(set(self.nodes[1].getrawmempool()), set(mempool_0))
         self.log.info("Mempool ok")
 
-        assert w1.getbalance() <= Decimal("49.00000000")
+        assert balance_w1_after <= balance_w1 - COIN
 
+        # generate() already runs sync_all(), so the mempools are in sync here
         self.generate(self.nodes[0], 1)
 
-        self.sync_mempools()
-        mempool_length = len(self.nodes[0].getrawmempool())
+        mempool_length = self.nodes[0].getmempoolinfo()['size']
         assert mempool_length == 0
         self.log.info("Mempool 2 ok")
 
-        assert_equal(w2.getbalance(), Decimal("1.00000000"))
+        assert_equal(w2.getbalance(), COIN)
         
 
 if __name__ == '__main__':